@@ -17,7 +17,9 @@ from __future__ import annotations
 import argparse
 import datetime as _dt
 import json
+import os
 import sys
+import time
 from pathlib import Path
 
 LOG_PATH = Path("ACTIVITY.log.jsonl")
@@ -39,9 +41,17 @@ def _parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+def _now_utc() -> str:
+    now = time.gmtime()
+    return (
+        f"{now.tm_year:04d}-{now.tm_mon:02d}-{now.tm_mday:02d}"
+        f"T{now.tm_hour:02d}:{now.tm_min:02d}:{now.tm_sec:02d}Z"
+    )
+
+
 def _render_timestamp(raw: str) -> str:
     if raw.lower() == "now":
-        return _dt.datetime.now(tz=_dt.timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
+        return _now_utc()
     try:
         parsed = _dt.datetime.fromisoformat(raw.replace("Z", "+00:00"))
     except ValueError as exc:  # pragma: no cover - user input
@@ -62,9 +72,16 @@ def main() -> None:
         "how": args.how,
         "protip": args.protip,
     }
-    with LOG_PATH.open("a", encoding="utf-8") as handle:
-        json.dump(entry, handle, ensure_ascii=False)
-        handle.write("\n")
+    line = (json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8")
+    # One O_APPEND write per entry keeps concurrent loggers from interleaving
+    # lines on local POSIX filesystems (not guaranteed on NFS).
+    fd = os.open(LOG_PATH, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o666)
+    try:
+        written = os.write(fd, line)
+    finally:
+        os.close(fd)
+    if written != len(line):
+        raise OSError(f"short write to {LOG_PATH}: {written} of {len(line)} bytes")
 
 
 if __name__ == "__main__":  # pragma: no cover - CLI entry